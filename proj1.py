@@ -1,9 +1,32 @@
+import io
 import random
+import sys
 
-def create_quiz_questions():
+# Feedback by minimum score percentage, checked from highest threshold down.
+_FEEDBACK_BUCKETS = (
+    (100, "Congratulations! You got a perfect score!"),
+    (70, "Great job! You have a good understanding of the topics."),
+    (50, "Good effort! Keep practicing to improve."),
+    (0, "You might need to review some topics. Don't give up!"),
+)
+
+class QuizQuestion:
+    """
+    A single multiple-choice question with its options and correct answer.
+    The question and its options are pre-rendered into `rendered`, ready to print.
+    """
+    __slots__ = ("question", "options", "answer", "rendered")
+
+    def __init__(self, question, options, answer):
+        self.question = question
+        self.options = tuple(options)
+        self.answer = answer
+        self.rendered = question + "\n" + "".join("  " + option + "\n" for option in self.options)
+
+def _build_quiz_questions():
     """
     Defines the quiz questions, options, and correct answers.
-    Returns a list of dictionaries, where each dictionary represents a question.
+    Returns a tuple of QuizQuestion objects.
     """
     questions = [
         {
@@ -32,14 +55,23 @@ def create_quiz_questions():
             "answer": "B"
         }
     ]
-    return questions
+    return tuple(QuizQuestion(**q_data) for q_data in questions)
+
+# Built once at import; every quiz run shares the same question bank.
+_QUIZ_QUESTIONS = _build_quiz_questions()
+
+def create_quiz_questions():
+    """
+    Returns the quiz questions as a tuple of QuizQuestion objects.
+    """
+    return _QUIZ_QUESTIONS
 
 def run_quiz(questions):
     """
     Runs the quiz game, presents questions, tracks score, and collects answers.
     
     Args:
-        questions (list): A list of question dictionaries.
+        questions (tuple): A sequence of QuizQuestion objects. It is not modified.
 
     Returns:
         tuple: A tuple containing the user's score and the total number of questions.
@@ -47,24 +79,27 @@ def run_quiz(questions):
     score = 0
     total_questions = len(questions)
     
-    # Shuffle questions to provide a different experience each time
-    random.shuffle(questions)
+    # Shuffle the question order to provide a different experience each time
+    order = list(range(total_questions))
+    random.shuffle(order)
+    prefixes = [f"Question {i + 1}/{total_questions}: " for i in range(total_questions)]
 
     print("--- Welcome to the Quiz Game! ---")
     print("Answer the following multiple-choice questions. Enter A, B, C, or D.\n")
 
-    for i, q_data in enumerate(questions):
-        print(f"Question {i + 1}/{total_questions}: {q_data['question']}")
-        for option in q_data['options']:
-            print(f"  {option}")
+    for i, q_index in enumerate(order):
+        question = questions[q_index]
+        correct = question.answer
+
+        sys.stdout.write(prefixes[i] + question.rendered)
         
         user_answer = input("Your answer: ").strip().upper()
 
-        if user_answer == q_data['answer']:
+        if user_answer == correct:
             print("Correct!\n")
             score += 1
         else:
-            print(f"Incorrect. The correct answer was {q_data['answer']}.\n")
+            print(f"Incorrect. The correct answer was {correct}.\n")
     
     return score, total_questions
 
@@ -76,21 +111,16 @@ def display_results(score, total_questions):
         score (int): The user's final score.
         total_questions (int): The total number of questions in the quiz.
     """
-    print("--- Quiz Finished! ---")
-    print(f"You scored {score} out of {total_questions} questions.")
-
     percentage = (score / total_questions) * 100
+    feedback = next(message for threshold, message in _FEEDBACK_BUCKETS if percentage >= threshold)
 
-    if percentage == 100:
-        print("Congratulations! You got a perfect score!")
-    elif percentage >= 70:
-        print("Great job! You have a good understanding of the topics.")
-    elif percentage >= 50:
-        print("Good effort! Keep practicing to improve.")
-    else:
-        print("You might need to review some topics. Don't give up!")
-
-    print("\nThanks for playing!")
+    # Build the whole summary first and write it in one go
+    buf = io.StringIO()
+    buf.write("--- Quiz Finished! ---\n")
+    buf.write(f"You scored {score} out of {total_questions} questions.\n")
+    buf.write(feedback + "\n")
+    buf.write("\nThanks for playing!\n")
+    sys.stdout.write(buf.getvalue())
 
 def main():
     """
@@ -1,5 +1,10 @@
 import requests
 import json
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 # --- Simulated Exchange Rates ---
 # In a real application, you would fetch these from a live API.
@@ -19,6 +24,21 @@ EXCHANGE_RATES = {
     "BRL": 5.43, # 1 USD = 5.43 BRL
 }
 
+def update_exchange_rates(new_rates: dict):
+    """
+    Merges new rates into EXCHANGE_RATES after checking every value.
+
+    Args:
+        new_rates (dict): Currency codes mapped to rates relative to the same base currency.
+
+    Raises:
+        ValueError: If any rate is not a positive, finite number. EXCHANGE_RATES is left unchanged.
+    """
+    for code, rate in new_rates.items():
+        if isinstance(rate, bool) or not isinstance(rate, (int, float)) or not 0 < rate < float("inf"):
+            raise ValueError(f"Invalid exchange rate for {code!r}: {rate!r}")
+    EXCHANGE_RATES.update(new_rates)
+
 # --- API Integration Placeholder (Conceptual) ---
 # To use a real API, you would typically do something like this:
 # API_KEY = "YOUR_OPENEXCHANGERATES_API_KEY" # Get your API key
@@ -38,27 +58,74 @@ EXCHANGE_RATES = {
 # # You would call this at the start of your application or periodically:
 # # live_rates = fetch_live_exchange_rates(API_URL)
 # # if live_rates:
-# #     EXCHANGE_RATES.update(live_rates) # Update your global rates
+# #     update_exchange_rates(live_rates) # Update your global rates
 
 
+# --- User Prompts ---
+_PROMPT_AMOUNT = "\nEnter the amount to convert: "
+_PROMPT_FROM = "Convert from currency (e.g., USD, EUR): "
+_PROMPT_TO = "Convert to currency (e.g., JPY, GBP): "
+_format_unsupported = "Currency '{}' not supported. Please choose from the list above.".format
+
+# --- Cached Rate Data ---
+# Derived from EXCHANGE_RATES by _build_rate_tables(). _RATES_SNAPSHOT is the copy
+# they were built from, so a direct edit to EXCHANGE_RATES triggers a rebuild.
+_RATES_SNAPSHOT: dict[str, float] = {}
+_CODES: tuple[str, ...] = ()
+_CURRENCY_BANNER: str = ""
+
+# Supported currency codes, for membership checks on user input.
+_VALID_CODES: frozenset[str] = frozenset()
+
+def _render_currency_banner(codes) -> str:
+    """
+    Renders the list of available currency codes as a single string.
+    """
+    return (
+        "\n--- Available Currencies ---\n"
+        + "".join(f"- {currency_code}\n" for currency_code in codes)
+        + "----------------------------\n"
+    )
+
+def _build_rate_tables():
+    """
+    Rebuilds the cached data from the current EXCHANGE_RATES.
+    """
+    global _RATES_SNAPSHOT, _CODES, _CURRENCY_BANNER, _VALID_CODES
+    _RATES_SNAPSHOT = dict(EXCHANGE_RATES)
+    # Sort currency codes alphabetically for better readability
+    _CODES = tuple(sorted(EXCHANGE_RATES))
+    _CURRENCY_BANNER = _render_currency_banner(_CODES)
+    _VALID_CODES = frozenset(EXCHANGE_RATES)
+
+def _sync_rate_tables():
+    """
+    Rebuilds the cached data if EXCHANGE_RATES has changed since it was built.
+    """
+    if EXCHANGE_RATES != _RATES_SNAPSHOT:
+        _build_rate_tables()
+
+_build_rate_tables()
+
 def display_available_currencies(rates: dict):
     """
     Prints a list of available currency codes to the user.
     """
-    print("\n--- Available Currencies ---")
-    # Sort currency codes alphabetically for better readability
-    sorted_currencies = sorted(rates.keys())
-    for currency_code in sorted_currencies:
-        print(f"- {currency_code}")
-    print("----------------------------")
+    if rates is EXCHANGE_RATES:
+        _sync_rate_tables()
+        sys.stdout.write(_CURRENCY_BANNER)
+    else:
+        sys.stdout.write(_render_currency_banner(sorted(rates)))
 
 def get_user_input():
     """
     Gets amount, source currency, and target currency from the user.
     """
+    _sync_rate_tables()
+
     while True:
         try:
-            amount = float(input("\nEnter the amount to convert: "))
+            amount = float(input(_PROMPT_AMOUNT))
             if amount <= 0:
                 print("Amount must be a positive number. Please try again.")
                 continue
@@ -67,29 +134,31 @@ def get_user_input():
             print("Invalid amount. Please enter a numerical value.")
 
     while True:
-        from_currency = input("Convert from currency (e.g., USD, EUR): ").strip().upper()
-        if from_currency not in EXCHANGE_RATES:
-            print(f"Currency '{from_currency}' not supported. Please choose from the list above.")
+        from_currency = input(_PROMPT_FROM).strip().upper()
+        if from_currency not in _VALID_CODES:
+            print(_format_unsupported(from_currency))
             display_available_currencies(EXCHANGE_RATES)
         else:
             break
 
     while True:
-        to_currency = input("Convert to currency (e.g., JPY, GBP): ").strip().upper()
-        if to_currency not in EXCHANGE_RATES:
-            print(f"Currency '{to_currency}' not supported. Please choose from the list above.")
+        to_currency = input(_PROMPT_TO).strip().upper()
+        if to_currency not in _VALID_CODES:
+            print(_format_unsupported(to_currency))
             display_available_currencies(EXCHANGE_RATES)
         elif to_currency == from_currency:
             print("Source and target currencies cannot be the same. Please choose a different target currency.")
         else:
             break
             
-    return amount, from_currency, to_currency
+    # Intern only validated codes, so later dict lookups can match the table's keys by identity
+    return amount, sys.intern(from_currency), sys.intern(to_currency)
 
-def convert_currency(amount: float, from_currency: str, to_currency: str, rates: dict) -> float | None:
+def convert_currency(amount: float, from_currency: str, to_currency: str, rates: dict) -> float:
     """
     Converts an amount from one currency to another using the provided exchange rates.
     All rates are assumed to be relative to a common base (e.g., USD in EXCHANGE_RATES).
+    Currency codes must already be validated (get_user_input does this).
 
     Args:
         amount (float): The amount to convert.
@@ -98,38 +167,97 @@ def convert_currency(amount: float, from_currency: str, to_currency: str, rates:
         rates (dict): A dictionary of exchange rates relative to a common base currency.
 
     Returns:
-        float | None: The converted amount, or None if conversion is not possible.
+        float: The converted amount.
+
+    Raises:
+        KeyError: If either currency code is not in rates.
     """
-    if from_currency not in rates or to_currency not in rates:
-        print("One or both currencies are not available for conversion.")
-        return None
+    # Convert to the base currency (USD in our example), then to the target currency
+    return amount / rates[from_currency] * rates[to_currency]
 
-    try:
-        # Convert the 'from_currency' amount to the base currency (USD in our example)
-        amount_in_base = amount / rates[from_currency]
-        
-        # Convert the base currency amount to the 'to_currency'
-        converted_amount = amount_in_base * rates[to_currency]
-        
-        return converted_amount
-    except ZeroDivisionError:
-        print("Error: Exchange rate for source currency is zero, which is not possible.")
-        return None
-    except Exception as e:
-        print(f"An error occurred during conversion: {e}")
-        return None
+def convert_currency_batch(amounts: "np.ndarray", from_code: str, to_codes: list[str], rates: dict) -> "np.ndarray":
+    """
+    Converts many amounts from one currency into several target currencies at once.
+
+    Args:
+        amounts (np.ndarray): 1-D array of amounts in the source currency.
+        from_code (str): The source currency code.
+        to_codes (list[str]): The target currency codes.
+        rates (dict): A dictionary of exchange rates relative to a common base currency.
+
+    Returns:
+        np.ndarray: A (len(amounts), len(to_codes)) array where row i, column j is
+        amounts[i] converted into to_codes[j].
+    """
+    # Imported here so the interactive converter does not pay numpy's import cost
+    import numpy as np
+
+    amounts = np.asarray(amounts, dtype=np.float64)
+    rate_vec = np.array([rates[code] for code in to_codes], dtype=np.float64)
+    inv_from = 1.0 / rates[from_code]
+    return amounts[:, None] * (rate_vec * inv_from)[None, :]
+
+def convert_all(amount: float, from_code: str, rates: dict) -> dict[str, float]:
+    """
+    Converts an amount into every currency in the provided exchange rates at once.
+
+    Args:
+        amount (float): The amount to convert.
+        from_code (str): The source currency code.
+        rates (dict): A dictionary of exchange rates relative to a common base currency.
+
+    Returns:
+        dict[str, float]: The converted amount for each currency code, sorted by code.
+    """
+    if rates is EXCHANGE_RATES:
+        _sync_rate_tables()
+        codes = _CODES
+    else:
+        codes = sorted(rates)
+    # Same arithmetic as convert_currency, with the base amount computed once
+    amount_in_base = amount / rates[from_code]
+    return {code: amount_in_base * rates[code] for code in codes}
+
+def conversion_stream(rates: dict):
+    """
+    Generator that performs conversions sent to it, keeping I/O out of the conversion logic.
+
+    Prime it with next(), then send (amount, from_currency, to_currency) tuples;
+    each send returns the converted amount. A request that cannot be converted
+    prints an error and yields None, and the stream keeps accepting requests.
+
+    Args:
+        rates (dict): A dictionary of exchange rates relative to a common base currency.
+
+    Yields:
+        float | None: The converted amount for the most recently sent request.
+    """
+    converted = None
+    while True:
+        amount, from_currency, to_currency = yield converted
+        try:
+            converted = convert_currency(amount, from_currency, to_currency, rates)
+        except KeyError:
+            print("One or both currencies are not available for conversion.")
+            converted = None
+        except ZeroDivisionError:
+            print("Error: Exchange rate for source currency is zero, which is not possible.")
+            converted = None
 
 def main():
     """
     Main function to run the currency converter application.
     """
     print("Welcome to the Simple Currency Converter!")
+
+    conversions = conversion_stream(EXCHANGE_RATES)
+    next(conversions)
     
     while True:
         display_available_currencies(EXCHANGE_RATES)
         amount, from_cur, to_cur = get_user_input()
 
-        converted_value = convert_currency(amount, from_cur, to_cur, EXCHANGE_RATES)
+        converted_value = conversions.send((amount, from_cur, to_cur))
 
         if converted_value is not None:
             print(f"\n{amount:,.2f} {from_cur} is equal to {converted_value:,.2f} {to_cur}")